@@ -4,11 +4,24 @@ import pywinstyles
 import os
 import re  # For sanitizing file names
 import json
+import hashlib  # For naming cached thumbnails
+import glob  # For finding a source image's cached thumbnails
+try:
+    import orjson  # Faster JSON parsing/serialization when available
+except ImportError:
+    orjson = None
+try:
+    import ijson  # Incremental parsing of large inventory files when available
+except ImportError:
+    ijson = None
 import shutil  # Import shutil to handle file operations
 from PIL import Image, ImageTk, UnidentifiedImageError  # For image display
 import sys
+import threading  # For writing the inventory off the GUI thread
 from tkinter import ttk
 import traceback  # To help with error logging
+import bisect  # For keeping band/album name lists sorted
+from collections import OrderedDict, defaultdict  # For the image cache and import batching
 
 def resource_path(relative_path):
     """ Get the absolute path to resource, works for dev and for PyInstaller bundle """
@@ -32,6 +45,44 @@ BANNER_FILE = resource_path("banner.png")
 INVENTORY_FILE = os.path.join(BASE_DIR, "inventory.json")
 EXPORT_FILE = os.path.join(BASE_DIR, "vinyl_collection.txt")
 IMAGES_DIR = os.path.join(BASE_DIR, "images")
+THUMBS_DIR = os.path.join(IMAGES_DIR, ".thumbs")
+IMAGE_CACHE_SIZE = 32  # Number of album images kept in memory for quick reselection
+# Without orjson, inventory files at least this big are parsed incrementally with ijson
+INVENTORY_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# Resolved once at startup rather than while building the window
+BANNER_EXISTS = os.path.exists(BANNER_FILE)
+os.makedirs(IMAGES_DIR, exist_ok=True)
+
+# Resampling filter for resizing images (Pillow >= 9.1 moved it to Image.Resampling)
+RESAMPLE_FILTER = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.ANTIALIAS
+
+# Characters not allowed in band/album names (and stripped from image file names)
+_FORBIDDEN_RE = re.compile(r'[<>:"/\\|?*]')
+
+# One "Band - Album" line of an imported collection, with surrounding whitespace trimmed.
+# Matched against raw UTF-8 bytes so only the captured names need decoding.
+_IMPORT_RE = re.compile(rb'^\s*(.*?\S)\s* - \s*(\S.*?)\s*$')
+
+# JSON backend: prefer orjson, fall back to the standard library
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def json_loads(raw):
+        return orjson.loads(raw)
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def json_loads(raw):
+        return json.loads(raw)
+
+    def json_dumps(obj):
+        return json.dumps(obj, indent=4).encode("utf-8")
+
+INVENTORY_PARSE_ERRORS = (JSONDecodeError, ijson.JSONError) if ijson is not None else (JSONDecodeError,)
 
 def handle_error(message, exception=None):
     """Display a messagebox with the error and optionally log details to a file."""
@@ -46,9 +97,100 @@ def handle_error(message, exception=None):
                 if exception:
                     log_file.write(traceback.format_exc() + "\n")
 
+def load_scaled_image(path, size):
+    """Open an image and scale it to fit within size, padding to exactly size with white."""
+    img = Image.open(path)
+    # For JPEGs, let the decoder scale down during decode (1/2, 1/4, 1/8) instead of
+    # decoding at full resolution first
+    img.draft('RGB', size)
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA')
+    # Scale up or down so the image fills as much of the box as its aspect ratio allows
+    scale = min(size[0] / img.width, size[1] / img.height)
+    scaled_size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    if img.size != scaled_size:
+        img = img.resize(scaled_size, RESAMPLE_FILTER)
+    if img.size != size:
+        padded = Image.new('RGB', size, "#FFFFFF")
+        offset = ((size[0] - img.width) // 2, (size[1] - img.height) // 2)
+        padded.paste(img, offset, img if img.mode == 'RGBA' else None)
+        img = padded
+    return img
+
+def image_cache_key(path):
+    """Return a canonical form of path, so one file always maps to one cache entry."""
+    return os.path.normcase(os.path.abspath(path))
+
+def thumbnail_prefix(path):
+    """Return the file name prefix shared by every cached thumbnail of the image at path."""
+    return hashlib.sha1(image_cache_key(path).encode("utf-8")).hexdigest()
+
+def thumbnail_path(path):
+    """Return the cache file used for the resized copy of the image at path.
+
+    The source's modification time and size are part of the name, so a different file
+    saved under the same name (even one with an older mtime) never hits a stale entry.
+    Raises OSError if path does not exist.
+    """
+    st = os.stat(path)
+    version = hashlib.sha1(f"{st.st_mtime_ns}|{st.st_size}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(THUMBS_DIR, f"{thumbnail_prefix(path)}-{version}.png")
+
+def load_cached_image(path, size):
+    """Load the resized image from the thumbnail cache, creating the cache entry if missing."""
+    thumb = thumbnail_path(path)
+    if os.path.exists(thumb):
+        img = None
+        try:
+            img = Image.open(thumb)
+            img.load()
+            return img
+        except Exception as e:
+            if img is not None:
+                img.close()  # Release the file handle so the thumbnail can be replaced
+            # A damaged thumbnail is rebuilt from the source below
+            if debug_messages:
+                print(f"[DEBUG] Discarding unreadable thumbnail '{thumb}': {e}")
+
+    img = load_scaled_image(path, size)
+    # Drop this source's other (stale or damaged) thumbnails before writing the new one
+    remove_cached_thumbnail(path)
+    tmp_path = thumb + ".tmp"
+    try:
+        os.makedirs(THUMBS_DIR, exist_ok=True)
+        img.save(tmp_path, "PNG")
+        # Swap into place so a partly written thumbnail is never picked up
+        os.replace(tmp_path, thumb)
+    except OSError as e:
+        # The cache is only an optimization; still show the image if it can't be written
+        if debug_messages:
+            print(f"[DEBUG] Failed to write thumbnail '{thumb}': {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return img
+
+def remove_cached_thumbnail(path):
+    """Delete every cached thumbnail for path. The source file does not need to exist."""
+    for thumb in glob.glob(os.path.join(THUMBS_DIR, thumbnail_prefix(path) + "-*.png")):
+        try:
+            os.remove(thumb)
+        except OSError:
+            pass
+
 class VinylTrackerApp:
     def __init__(self, root):
         self.root = root
+
+        # Decode the banner in the background while the data loads and the widgets are built
+        self._banner_image = None
+        self._banner_error = None
+        self._banner_thread = None
+        if BANNER_EXISTS:
+            self._banner_thread = threading.Thread(target=self._decode_banner, daemon=True)
+            self._banner_thread.start()
+
         self.root.title("Vinyl Tracker")
         self.root.geometry("1024x700")
         self.root.resizable(False, False)
@@ -68,6 +210,16 @@ class VinylTrackerApp:
         self.selected_band = None
         self.selected_album = None
         
+        self._dirty = False  # True when self.data has changes not yet written to disk
+        self._pending_lock = threading.Lock()  # Guards _pending_save (held only briefly)
+        self._write_lock = threading.Lock()  # Serializes inventory file writes
+        self._pending_save = None  # Latest serialized data waiting to be written
+        self._save_error = None  # (message, exception) from the last failed write, shown by the GUI thread
+        self._save_thread = None
+        self._img_cache = OrderedDict()  # image_cache_key(path) -> PhotoImage, least recently used first
+        self._sorted_bands = []  # Band names in display order, kept in sync with self.data
+        self._sorted_albums = {}  # band name -> album names in display order
+        
         self.load_data()
         self.setup_gui()
         self.refresh_bands()
@@ -90,12 +242,26 @@ class VinylTrackerApp:
     def load_data(self):
         """Load data from INVENTORY_FILE or create a new structure if not found."""
         try:
-            with open(INVENTORY_FILE, "r", encoding="utf-8") as f:
+            with open(INVENTORY_FILE, "rb") as f:
                 try:
-                    self.data = json.load(f)
-                except json.JSONDecodeError as e:
+                    if orjson is None and ijson is not None and os.fstat(f.fileno()).st_size >= INVENTORY_STREAM_THRESHOLD:
+                        # Build the data from parse events instead of reading the whole file
+                        # into memory and decoding it first (orjson is faster, so it wins when present)
+                        self.data = dict(ijson.kvitems(f, "", use_float=True))
+                        for band_data in self.data.get("bands", {}).values():
+                            self.normalize_band_images(band_data)
+                    elif orjson is None:
+                        # The stdlib parser can normalize image fields while parsing,
+                        # rather than in a separate pass (orjson has no object_hook)
+                        self.data = json.loads(f.read(), object_hook=self.normalize_image_field)
+                    else:
+                        self.data = json_loads(f.read())
+                        for band_data in self.data.get("bands", {}).values():
+                            self.normalize_band_images(band_data)
+                except INVENTORY_PARSE_ERRORS as e:
                     handle_error(f"Failed to parse '{INVENTORY_FILE}'. The file may be corrupted. Starting with empty data.", e)
                     self.data = {"bands": {}}
+                    self._dirty = False
         except FileNotFoundError:
             if debug_messages:
                 print(f"[DEBUG] '{INVENTORY_FILE}' not found. Initialized empty data structure.")
@@ -103,30 +269,106 @@ class VinylTrackerApp:
         except Exception as e:
             handle_error(f"Failed to load data from '{INVENTORY_FILE}'.", e)
             self.data = {"bands": {}}
+            self._dirty = False
 
-        # Normalize image fields
-        for band, band_data in self.data.get("bands", {}).items():
-            for album, album_data in band_data.get("albums", {}).items():
-                if album_data.get("image") == "":
-                    self.data["bands"][band]["albums"][album]["image"] = None
-
+        # Only rewrite the file if normalization actually changed something
         self.save_data()
 
-    def save_data(self):
-        """Write the entire data dictionary back to the inventory file."""
+        self.rebuild_sorted_names()
+
+    def normalize_image_field(self, obj):
+        """JSON object hook that replaces an empty image path with None."""
+        if obj.get("image") == "":
+            obj["image"] = None
+            self._dirty = True
+        return obj
+
+    def normalize_band_images(self, band_data):
+        """Normalize the image field of every album in one band's data."""
+        for album_data in band_data.get("albums", {}).values():
+            self.normalize_image_field(album_data)
+
+    def rebuild_sorted_names(self):
+        """Rebuild the sorted band/album name lists from self.data."""
+        bands = self.data.get("bands", {})
+        self._sorted_bands = sorted(bands)
+        self._sorted_albums = {band: sorted(band_data.get("albums", {})) for band, band_data in bands.items()}
+
+    def save_data(self, wait=False):
+        """Write the entire data dictionary back to the inventory file if it has changed.
+
+        The data is serialized on the GUI thread so the snapshot is consistent, then
+        written by a background thread. Pass wait=True to block until the write is done.
+        """
+        if not self._dirty:
+            return
         try:
-            with open(INVENTORY_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=4)
-            if debug_messages:
-                print(f"[DEBUG] Data saved successfully to '{INVENTORY_FILE}'.")
-        except IOError as e:
-            handle_error("Failed to save data. Check file permissions and disk space.", e)
+            # Serialize once and write in a single call rather than one write per token
+            payload = json_dumps(self.data)
         except Exception as e:
             handle_error("An unexpected error occurred while saving data.", e)
+            return
+        self._dirty = False
+
+        with self._pending_lock:
+            self._pending_save = payload
+        thread = threading.Thread(target=self._write_pending_save, daemon=True)
+        self._save_thread = thread
+        thread.start()
+        if wait:
+            thread.join()
+        else:
+            self.root.after(100, self._check_save_thread, thread)
+
+    def _write_pending_save(self):
+        """Write the most recent pending payload to a temp file and swap it into place.
+
+        Runs on a worker thread, so it must not touch Tk; failures are recorded in
+        self._save_error for the GUI thread to report.
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                payload = self._pending_save
+                self._pending_save = None
+            if payload is None:
+                # A later thread already wrote a newer snapshot
+                return
+            tmp_path = INVENTORY_FILE + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                # Atomic on the same filesystem, so a crash never leaves a torn inventory
+                os.replace(tmp_path, INVENTORY_FILE)
+                self._save_error = None  # The newest data is on disk now
+                if debug_messages:
+                    print(f"[DEBUG] Data saved successfully to '{INVENTORY_FILE}'.")
+            except IOError as e:
+                self._dirty = True  # Retry on the next save
+                self._save_error = ("Failed to save data. Check file permissions and disk space.", e)
+            except Exception as e:
+                self._dirty = True
+                self._save_error = ("An unexpected error occurred while saving data.", e)
+
+    def _check_save_thread(self, thread):
+        """Poll a background save from the GUI thread and report any failure once it finishes."""
+        if thread.is_alive():
+            self.root.after(100, self._check_save_thread, thread)
+        else:
+            self._report_save_error()
+
+    def _report_save_error(self):
+        """Show the error from the last failed background write, if any."""
+        if self._save_error is not None:
+            message, exception = self._save_error
+            self._save_error = None
+            handle_error(message, exception)
 
     def on_closing(self):
-        # Save data before exit.
-        self.save_data()
+        # Save data before exit and wait for any in-flight write to finish.
+        if self._save_thread is not None:
+            self._save_thread.join()
+        self.save_data(wait=True)
+        self._report_save_error()
         self.root.destroy()
 
     def setup_gui(self):
@@ -134,24 +376,10 @@ class VinylTrackerApp:
         bg_color = "#EEE9E5"
         self.root.config(bg=bg_color)
 
-        # Banner frame
-        banner_frame = tk.Frame(self.root, bg=bg_color, height=120)
-        banner_frame.pack(side=tk.TOP, fill=tk.X)
-        banner_frame.pack_propagate(False)
-
-        if os.path.exists(BANNER_FILE):
-            try:
-                banner_image = Image.open(BANNER_FILE)
-                resample_filter = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.ANTIALIAS
-                banner_image = banner_image.resize((1024, 120), resample_filter)
-                self.banner_photo = ImageTk.PhotoImage(banner_image)
-                banner_label = tk.Label(banner_frame, image=self.banner_photo)
-                banner_label.pack(fill=tk.BOTH, expand=True)
-            except Exception as e:
-                handle_error("Failed to load banner image.", e)
-                banner_frame.config(bg=bg_color)
-        else:
-            banner_frame.config(bg=bg_color)
+        # Banner frame (the image is attached once the window is built)
+        self.banner_frame = tk.Frame(self.root, bg=bg_color, height=120)
+        self.banner_frame.pack(side=tk.TOP, fill=tk.X)
+        self.banner_frame.pack_propagate(False)
 
         # Header frame
         header_frame = tk.Frame(self.root, bg=bg_color, height=50)
@@ -252,37 +480,49 @@ class VinylTrackerApp:
         self.remove_image_button = tk.Button(right_buttons_subframe, text="Remove Image", command=self.remove_image, state=tk.DISABLED)
         self.remove_image_button.pack(side=tk.LEFT, padx=5)
 
-        if not os.path.exists(IMAGES_DIR):
-            os.makedirs(IMAGES_DIR)
+        self._attach_banner()
+
+    def _decode_banner(self):
+        """Load and resize the banner image. Runs on a worker thread, so it must not touch Tk."""
+        try:
+            banner_image = Image.open(BANNER_FILE)
+            banner_image.draft('RGB', (1024, 120))  # No-op unless the banner is a JPEG
+            self._banner_image = banner_image.resize((1024, 120), RESAMPLE_FILTER)
+        except Exception as e:
+            self._banner_error = e
+
+    def _attach_banner(self):
+        """Wait for the banner decode to finish and show it in the banner frame."""
+        if self._banner_thread is None:
+            return
+        self._banner_thread.join()
+        if self._banner_error is not None:
+            handle_error("Failed to load banner image.", self._banner_error)
+            return
+        try:
+            self.banner_photo = ImageTk.PhotoImage(self._banner_image)
+            banner_label = tk.Label(self.banner_frame, image=self.banner_photo)
+            banner_label.pack(fill=tk.BOTH, expand=True)
+        except Exception as e:
+            handle_error("Failed to load banner image.", e)
+        self._banner_image = None  # The PhotoImage holds its own copy
 
     def refresh_bands(self):
         self.band_listbox.delete(0, tk.END)
-        band_names = sorted(self.data["bands"].keys())
-        for name in band_names:
-            self.band_listbox.insert(tk.END, name)
+        # Insert all names in one Tcl call rather than one call per name
+        if self._sorted_bands:
+            self.band_listbox.insert(tk.END, *self._sorted_bands)
         self.selected_band = None
-        self.selected_album = None
         self.delete_band_button.config(state=tk.DISABLED)
         self.add_album_button.config(state=tk.DISABLED)
-        self.delete_album_button.config(state=tk.DISABLED)
-        self.associate_image_button.config(state=tk.DISABLED)
-        self.remove_image_button.config(state=tk.DISABLED)
         self.album_listbox.delete(0, tk.END)
-        self.image_label.config(text="No album selected")
-        self.image_canvas.delete("all")
+        self._clear_album_selection()
 
     def refresh_albums(self, band_name):
         self.album_listbox.delete(0, tk.END)
-        if band_name and band_name in self.data["bands"]:
-            albums = sorted(self.data["bands"][band_name]["albums"].keys())
-            for album_name in albums:
-                self.album_listbox.insert(tk.END, album_name)
-        self.selected_album = None
-        self.delete_album_button.config(state=tk.DISABLED)
-        self.associate_image_button.config(state=tk.DISABLED)
-        self.remove_image_button.config(state=tk.DISABLED)
-        self.image_label.config(text="No album selected")
-        self.image_canvas.delete("all")
+        if band_name and band_name in self.data["bands"] and self._sorted_albums[band_name]:
+            self.album_listbox.insert(tk.END, *self._sorted_albums[band_name])
+        self._clear_album_selection()
 
     def on_band_select(self, event):
         if not self.band_listbox.curselection():
@@ -331,36 +571,35 @@ class VinylTrackerApp:
                     self.image_canvas.delete("all")
                     self.remove_image_button.config(state=tk.DISABLED)
             else:
-                self.selected_album = None
-                self.delete_album_button.config(state=tk.DISABLED)
-                self.associate_image_button.config(state=tk.DISABLED)
-                self.remove_image_button.config(state=tk.DISABLED)
-                self.image_label.config(text="No album selected")
-                self.image_canvas.delete("all")
+                self._clear_album_selection()
         except KeyError as e:
             handle_error(f"Error: {e}", e)
-            self.selected_album = None
-            self.delete_album_button.config(state=tk.DISABLED)
-            self.associate_image_button.config(state=tk.DISABLED)
-            self.remove_image_button.config(state=tk.DISABLED)
-            self.image_label.config(text="No album selected")
-            self.image_canvas.delete("all")
+            self._clear_album_selection()
         except Exception as e:
             handle_error("An error occurred while selecting the album.", e)
-            self.selected_album = None
-            self.delete_album_button.config(state=tk.DISABLED)
-            self.associate_image_button.config(state=tk.DISABLED)
-            self.remove_image_button.config(state=tk.DISABLED)
-            self.image_label.config(text="No album selected")
-            self.image_canvas.delete("all")
+            self._clear_album_selection()
+
+    def _clear_album_selection(self):
+        """Reset the album selection and the image panel."""
+        self.selected_album = None
+        for button in (self.delete_album_button, self.associate_image_button, self.remove_image_button):
+            button.config(state=tk.DISABLED)
+        self.image_label.config(text="No album selected")
+        self.image_canvas.delete("all")
 
     def show_image(self, path):
         self.image_canvas.delete("all")
         try:
-            img = Image.open(path)
-            resample_filter = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.ANTIALIAS
-            img = img.resize((280, 310), resample_filter)
-            self.album_img = ImageTk.PhotoImage(img)
+            key = image_cache_key(path)
+            photo = self._img_cache.get(key)
+            if photo is None:
+                img = load_cached_image(path, (280, 310))
+                photo = ImageTk.PhotoImage(img)
+                self._img_cache[key] = photo
+                if len(self._img_cache) > IMAGE_CACHE_SIZE:
+                    self._img_cache.popitem(last=False)
+            self._img_cache.move_to_end(key)
+            self.album_img = photo
             self.image_canvas.create_image(0, 0, image=self.album_img, anchor='nw')
             self.image_label.config(text="")
         except FileNotFoundError:
@@ -373,13 +612,18 @@ class VinylTrackerApp:
             handle_error(f"Error loading image: {e}", e)
             self.image_label.config(text="Error loading image")
 
+    def discard_cached_image(self, path):
+        """Drop any cached copies (in memory and on disk) of the image at path."""
+        self._img_cache.pop(image_cache_key(path), None)
+        remove_cached_thumbnail(path)
+
     def validate_input(self, name):
         """Validate the input name for bands/albums."""
         if not name or len(name.strip()) == 0:
             return False, "Name cannot be empty."
         if len(name) > 100:
             return False, "Name is too long (maximum 100 characters)."
-        if re.search(r'[<>:"/\\|?*]', name):
+        if _FORBIDDEN_RE.search(name):
             return False, "Name contains forbidden characters: <>:\"/\\|?*"
         return True, ""
 
@@ -391,6 +635,9 @@ class VinylTrackerApp:
                 handle_error(f"Band '{band_name}' already exists.")
                 return
             self.data["bands"][band_name] = {"albums": {}}
+            bisect.insort(self._sorted_bands, band_name)
+            self._sorted_albums[band_name] = []
+            self._dirty = True
             self.save_data()
             self.refresh_bands()
             self.select_band_by_name(band_name)
@@ -399,7 +646,14 @@ class VinylTrackerApp:
         if self.selected_band:
             res = messagebox.askyesno("Confirm", f"Delete band '{self.selected_band}'?", parent=self.root)
             if res:
+                # The band's image files stay on disk, but their cached thumbnails are no longer needed
+                for album_data in self.data["bands"][self.selected_band]["albums"].values():
+                    if album_data.get("image"):
+                        self.discard_cached_image(os.path.join(BASE_DIR, album_data["image"]))
                 del self.data["bands"][self.selected_band]
+                self._sorted_bands.remove(self.selected_band)
+                del self._sorted_albums[self.selected_band]
+                self._dirty = True
                 self.save_data()
                 self.refresh_bands()
 
@@ -418,6 +672,8 @@ class VinylTrackerApp:
                 handle_error("Album already exists for this band.")
                 return
             self.data["bands"][self.selected_band]["albums"][album_name] = {"image": None}
+            bisect.insort(self._sorted_albums[self.selected_band], album_name)
+            self._dirty = True
             self.save_data()
             self.refresh_albums(self.selected_band)
             self.select_album_by_name(album_name)
@@ -435,10 +691,13 @@ class VinylTrackerApp:
                     image_path = os.path.join(BASE_DIR, image_rel_path)
                     if os.path.exists(image_path):
                         try:
+                            self.discard_cached_image(image_path)
                             os.remove(image_path)
                         except Exception as e:
                             handle_error("Failed to delete image.", e)
                 del self.data["bands"][self.selected_band]["albums"][self.selected_album]
+                self._sorted_albums[self.selected_band].remove(self.selected_album)
+                self._dirty = True
                 self.save_data()
                 self.refresh_albums(self.selected_band)
 
@@ -453,12 +712,13 @@ class VinylTrackerApp:
             try:
                 # Validate that the selected file is a valid image before proceeding
                 try:
-                    Image.open(img_path).close()  # Check if it's a valid image file
+                    with Image.open(img_path) as im:
+                        im.verify()  # Check the file's integrity without decoding the pixel data
                 except Exception as e:
                     handle_error("Selected file is not a valid image.", e)
                     return
 
-                sanitized_album_name = re.sub(r'[<>:"/\\|?*]', '', self.selected_album)
+                sanitized_album_name = _FORBIDDEN_RE.sub('', self.selected_album)
                 sanitized_album_name = sanitized_album_name.replace(' ', '_')
                 _, ext = os.path.splitext(img_path)
                 ext = ext.lower()
@@ -466,20 +726,29 @@ class VinylTrackerApp:
                     handle_error("Unsupported file type selected. Please choose a JPG or PNG file.")
                     return
 
-                dest_path = os.path.join(IMAGES_DIR, f"{sanitized_album_name}{ext}")
-                counter = 1
-                while os.path.exists(dest_path):
-                    dest_path = os.path.join(IMAGES_DIR, f"{sanitized_album_name}_{counter}{ext}")
-                    counter += 1
-                
-                try:
-                    shutil.copy(img_path, dest_path)
-                except Exception as e:
-                    handle_error(f"Failed to copy image to {dest_path}", e)
-                    return
+                if self.is_unused_library_image(img_path):
+                    # Already in the images folder and not used by another album, so no copy is needed
+                    # Rebuild the path with os.path so it matches the one other code paths use
+                    dest_path = os.path.join(IMAGES_DIR, os.path.basename(img_path))
+                else:
+                    # List the folder once instead of stat()ing every candidate name
+                    existing = {os.path.normcase(name) for name in os.listdir(IMAGES_DIR)}
+                    dest_name = f"{sanitized_album_name}{ext}"
+                    counter = 1
+                    while os.path.normcase(dest_name) in existing:
+                        dest_name = f"{sanitized_album_name}_{counter}{ext}"
+                        counter += 1
+                    dest_path = os.path.join(IMAGES_DIR, dest_name)
+
+                    try:
+                        shutil.copyfile(img_path, dest_path)  # Contents only, no metadata copy
+                    except Exception as e:
+                        handle_error(f"Failed to copy image to {dest_path}", e)
+                        return
 
                 final_rel_path = os.path.relpath(dest_path, start=BASE_DIR)
                 self.data["bands"][self.selected_band]["albums"][self.selected_album]["image"] = final_rel_path
+                self._dirty = True
                 self.save_data()
 
                 self.show_image(dest_path)
@@ -488,6 +757,22 @@ class VinylTrackerApp:
             except Exception as e:
                 handle_error("Failed to associate image.", e)
 
+    def is_unused_library_image(self, path):
+        """Return True if path is a file directly inside IMAGES_DIR that no album refers to."""
+        try:
+            if not os.path.samefile(os.path.dirname(os.path.abspath(path)), IMAGES_DIR):
+                return False
+        except OSError:
+            return False
+        # Albums own their image files (removing an image deletes it), so never share one
+        target = os.path.normcase(os.path.abspath(path))
+        for band_data in self.data["bands"].values():
+            for album_data in band_data["albums"].values():
+                image_rel_path = album_data.get("image")
+                if image_rel_path and os.path.normcase(os.path.abspath(os.path.join(BASE_DIR, image_rel_path))) == target:
+                    return False
+        return True
+
     def remove_image(self):
         if self.selected_band and self.selected_album:
             album_data = self.data["bands"][self.selected_band]["albums"].get(self.selected_album, {})
@@ -496,10 +781,12 @@ class VinylTrackerApp:
                 image_path = os.path.join(BASE_DIR, image_rel_path)
                 if os.path.exists(image_path):
                     try:
+                        self.discard_cached_image(image_path)
                         os.remove(image_path)
                     except Exception as e:
                         handle_error("Failed to delete image.", e)
             self.data["bands"][self.selected_band]["albums"][self.selected_album]["image"] = None
+            self._dirty = True
             self.save_data()
             self.image_label.config(text=f"No image for '{self.selected_album}'")
             self.image_canvas.delete("all")
@@ -566,15 +853,9 @@ class VinylTrackerApp:
 
     def export_collection(self):
         try:
-            bands = sorted(self.data["bands"].keys())
-            lines = []
-            for band in bands:
-                albums = sorted(self.data["bands"][band]["albums"].keys())
-                for album in albums:
-                    lines.append(f"{band} - {album}")
-            
             with open(EXPORT_FILE, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
+                # Stream lines straight to the file instead of building the whole text first
+                f.writelines(f"{band} - {album}\n" for band in self._sorted_bands for album in self._sorted_albums[band])
             
             messagebox.showinfo("Export Complete", f"The collection has been exported to {EXPORT_FILE}", parent=self.root)
         except Exception as e:
@@ -590,27 +871,32 @@ class VinylTrackerApp:
             return
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            # Collect the file's entries first, then merge them into the data in one pass
+            pending = defaultdict(dict)  # Used as ordered sets so file order is kept
+            with open(file_path, "rb") as f:
+                # Iterate the file directly so lines are processed as they are read
+                for line in f:
+                    if not (m := _IMPORT_RE.match(line)):
+                        continue  # Blank or invalid line, skip
+                    pending[m.group(1).decode("utf-8")].setdefault(m.group(2).decode("utf-8"), None)
 
             added_count = 0
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if " - " in line:
-                    parts = line.split(" - ")
-                    if len(parts) == 2:
-                        band_name, album_name = parts[0].strip(), parts[1].strip()
-                        if band_name and album_name:
-                            if band_name not in self.data["bands"]:
-                                self.data["bands"][band_name] = {"albums": {}}
-                            if album_name not in self.data["bands"][band_name]["albums"]:
-                                self.data["bands"][band_name]["albums"][album_name] = {"image": None}
-                                added_count += 1
-                            # If album already exists, skip
-                    # If invalid line, skip
-                # If invalid line, skip
+            new_bands = False
+            for band_name, album_names in pending.items():
+                if band_name not in self.data["bands"]:
+                    self.data["bands"][band_name] = {"albums": {}}
+                    new_bands = True
+                albums = self.data["bands"][band_name]["albums"]
+                # If album already exists, skip it so its image association is kept
+                new_albums = [album_name for album_name in album_names if album_name not in albums]
+                if new_albums:
+                    albums.update((album_name, {"image": None}) for album_name in new_albums)
+                    self._sorted_albums[band_name] = sorted(albums)
+                    added_count += len(new_albums)
+            if new_bands:
+                self._sorted_bands = sorted(self.data["bands"])
+            if added_count:
+                self._dirty = True
 
             self.save_data()
             self.refresh_bands()